@@ -97,7 +97,7 @@ def ingest_matches(session, df):
                 "country": row["country"],
             }
             data.append(match_data)
-        session.run(query, batch=data)
+        session.execute_write(lambda tx, rows=data: tx.run(query, batch=rows))
 
 
 def ingest_goals(session, df):
@@ -145,7 +145,7 @@ def ingest_goals(session, df):
 
         if data:
             try:
-                session.run(query, batch=data)
+                session.execute_write(lambda tx, rows=data: tx.run(query, batch=rows))
             except Exception as e:
                 logger.error(f"Error executing batch: {str(e)}")
                 logger.error(f"Problematic batch: {data}")
@@ -174,7 +174,7 @@ def ingest_shootouts(session, df):
                 ),
             }
             data.append(shootout_data)
-        session.run(query, batch=data)
+        session.execute_write(lambda tx, rows=data: tx.run(query, batch=rows))
 
 
 def main():
@@ -1,18 +1,27 @@
 from .versions import Neo4jVersion
 from .rules import (
     SIZE_PATTERN,
-    WITH_PATTERN,
-    APOC_PATTERN,
-    COUNT_RETURN_PATTERN,
-    COLLECT_RETURN_PATTERN,
     TOSTRING_PATTERN,
+    DOT_NAME_PATTERN,
+    V5_PROBE_PATTERN,
+    REWRITE_TRIGGER_PATTERN,
+    FORBIDDEN_PATTERN,
     rewrite_size_to_count,
     rewrite_apoc_to_native,
 )
 from .exceptions import UnsafeCypherError
 from .utils import extract_variables
+import functools
 import re
 
+# Compiled once at import; _sanitize_with_clause runs these per WITH item.
+_AS_ALIAS_RE = re.compile(r"\bAS\s+([a-zA-Z_][a-zA-Z0-9_]*)", re.IGNORECASE)
+_WITH_ITEM_RE = re.compile(
+    r"^(?P<expr>.*?)(?:\bAS\s+(?P<alias>[a-zA-Z_][a-zA-Z0-9_]*))?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 class CypherRewriter:
     """
     Version-aware Cypher rewriter with auto-repair.
@@ -34,10 +43,19 @@ class CypherRewriter:
     # ------------------
 
     def rewrite(self, query: str) -> str:
+        rewritten, changes = _rewrite_cached(
+            self.version, self.allow_apoc, self.strict, query
+        )
+        self.changes.extend(changes)
+        return rewritten
+
+    def _rewrite_uncached(self, query: str) -> str:
         original = query
         q = query.strip()
 
-        if self.version == Neo4jVersion.V5:
+        # Skip the whole v5 pipeline when no rewrite trigger is present;
+        # already-compliant queries go straight to validation.
+        if self.version == Neo4jVersion.V5 and REWRITE_TRIGGER_PATTERN.search(q):
             q = self._rewrite_for_v5(q)
 
         self._final_validation(q)
@@ -56,7 +74,9 @@ class CypherRewriter:
         if len(parts) < 2:
             return query
 
-        sanitized = parts[0]  # everything before first WITH
+        # Accumulate output fragments and join once at the end; growing a
+        # string with += re-copies the whole prefix per WITH clause.
+        chunks = [parts[0]]  # everything before first WITH
         defined_vars = set()
 
         for part in parts[1:]:
@@ -73,10 +93,8 @@ class CypherRewriter:
             for item in items:
                 # Get variable being declared or used
                 # Handle aliases: COUNT(r) AS total_edges -> total_edges
-                if " AS " in item.upper():
-                    var = item.upper().split(" AS ")[-1].strip()
-                else:
-                    var = item.split()[-1]
+                m = _WITH_ITEM_RE.match(item)
+                var = m.group("alias") or m.group("expr").rsplit(None, 1)[-1]
 
                 # Keep if already defined or new expression
                 # Expression detected if contains "(" or "="
@@ -87,30 +105,38 @@ class CypherRewriter:
                     # skip phantom variable
                     self.changes.append(f"Removed undefined variable from WITH: {var}")
 
-            sanitized += "WITH " + ", ".join(valid_items) + "\n" + rest
+            chunks.append("WITH ")
+            chunks.append(", ".join(valid_items))
+            chunks.append("\n")
+            chunks.append(rest)
 
             # Update defined_vars from this line
             for item in valid_items:
                 # capture declared alias after AS
-                m = re.search(r"AS\s+([a-zA-Z_][a-zA-Z0-9_]*)", item, re.IGNORECASE)
+                m = _AS_ALIAS_RE.search(item)
                 if m:
                     defined_vars.add(m.group(1))
                 # capture variable names used directly
                 for v in extract_variables(item):
                     defined_vars.add(v)
 
-        return sanitized
+        return "".join(chunks)
 
     def _rewrite_to_string_on_nodes(self, query: str) -> str:
         """
         Rewrite toString(nodeVar) into a safe representation.
         """
 
+        # Collect every variable referenced as `X.name` in one pass, so the
+        # replacer tests set membership instead of re-scanning the query
+        # for each toString() occurrence.
+        dot_name_vars = set(DOT_NAME_PATTERN.findall(query))
+
         def replacer(match: re.Match) -> str:
             var = match.group(1)
 
             # Heuristic 1: if `.name` is referenced anywhere, prefer it
-            if f"{var}.name" in query:
+            if var in dot_name_vars:
                 self.changes.append(
                     f"Rewrote toString({var}) → toString({var}.name)"
                 )
@@ -120,13 +146,7 @@ class CypherRewriter:
             self.changes.append(
                 f"Rewrote toString({var}) → node map representation"
             )
-            return (
-                "{ labels: labels("
-                + var
-                + "), properties: properties("
-                + var
-                + ") }"
-            )
+            return f"{{ labels: labels({var}), properties: properties({var}) }}"
 
         return TOSTRING_PATTERN.sub(replacer, query)
 
@@ -135,12 +155,13 @@ class CypherRewriter:
         Ensure variables used after WITH are preserved.
         """
 
-        parts = query.split("WITH")
-        if len(parts) < 2:
+        # Locate the first WITH by index; splitting and re-joining the whole
+        # query only to look at the text after it re-allocates the string.
+        idx = query.find("WITH")
+        if idx < 0:
             return query  # no WITH → nothing to repair
 
-        before_with = parts[0]
-        after_with = "WITH".join(parts[1:])
+        after_with = query[idx + len("WITH"):]
 
         # Extract variables used in RETURN
         return_match = re.search(r"RETURN\s+(.*)", after_with, re.IGNORECASE | re.DOTALL)
@@ -174,32 +195,37 @@ class CypherRewriter:
     def _rewrite_for_v5(self, query: str) -> str:
         q = query
 
+        # One combined scan finds every rule that can fire; the targeted
+        # rewriters below then only run for triggers actually present.
+        hits = {m.lastgroup for m in V5_PROBE_PATTERN.finditer(q)}
+
         # Step 0: sanitize phantom WITH variables
-        if WITH_PATTERN.search(q):
+        if "with_dot" in hits:
             q = self._sanitize_with_clause(q)
             self.changes.append("Rewrote WITH patterns to remove undefined variables")
 
         # 1️⃣ Rewrite size((pattern)) → COUNT { (pattern) }
-        if SIZE_PATTERN.search(q):
-            q = SIZE_PATTERN.sub(rewrite_size_to_count, q)
-            self.changes.append("Rewrote size((pattern)) → COUNT { }")
+        if "size" in hits:
+            q, substitutions = SIZE_PATTERN.subn(rewrite_size_to_count, q)
+            if substitutions:
+                self.changes.append("Rewrote size((pattern)) → COUNT { }")
 
         # 2️⃣ APOC handling
-        if APOC_PATTERN.search(q):
+        if "apoc" in hits:
             if not self.allow_apoc:
-                q = rewrite_apoc_to_native(q)
-                if APOC_PATTERN.search(q):
+                q, apoc_remaining = rewrite_apoc_to_native(q)
+                if apoc_remaining:
                     raise UnsafeCypherError("APOC usage is not allowed in Neo4j 5")
                 self.changes.append("Rewrote APOC to native Cypher")
 
         # 3️⃣ Invalid COUNT { RETURN ... }
-        if COUNT_RETURN_PATTERN.search(q):
+        if "count_return" in hits:
             raise UnsafeCypherError("COUNT { RETURN ... } is invalid Cypher")
 
-        if COLLECT_RETURN_PATTERN.search(q):
+        if "collect_return" in hits:
             raise UnsafeCypherError("collect { RETURN ... } is invalid Cypher")
 
-        if TOSTRING_PATTERN.search(q):
+        if "tostring" in hits:
             q = self._rewrite_to_string_on_nodes(q)
 
         q = self._repair_with_scope(q)
@@ -211,17 +237,27 @@ class CypherRewriter:
     # ------------------
 
     def _final_validation(self, query: str):
-        q = query.lower()
-
-        forbidden = [
-            "call dbms",
-            "drop ",
-            "delete ",
-            "set ",
-            "create ",
-            "merge ",
-        ]
-
-        for f in forbidden:
-            if f in q:
-                raise UnsafeCypherError(f"Forbidden operation detected: {f}")
+        match = FORBIDDEN_PATTERN.search(query)
+        if match:
+            raise UnsafeCypherError(
+                f"Forbidden operation detected: {match.group(0).lower()}"
+            )
+
+
+@functools.lru_cache(maxsize=1024)
+def _rewrite_cached(
+    version: Neo4jVersion,
+    allow_apoc: bool,
+    strict: bool,
+    query: str,
+) -> tuple[str, tuple[str, ...]]:
+    """
+    Pure rewrite of a query, memoized across rewriter instances.
+
+    LLM pipelines frequently resubmit identical queries; on a hit this turns
+    the whole rewrite into a dict lookup. UnsafeCypherError propagates and is
+    intentionally not cached, so rejected queries are re-validated each time.
+    """
+    rewriter = CypherRewriter(version=version, allow_apoc=allow_apoc, strict=strict)
+    rewritten = rewriter._rewrite_uncached(query)
+    return rewritten, tuple(rewriter.changes)
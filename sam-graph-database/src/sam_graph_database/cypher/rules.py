@@ -4,7 +4,15 @@ import re
 # Patterns
 # --------
 
-SIZE_PATTERN = re.compile(r"size\s*\(\s*\((.*?)\)\s*\)", re.IGNORECASE)
+# Explicit pattern-expression shape instead of lazy .*?: a node pattern
+# followed by non-paren connectors and node patterns. The branches are
+# disjoint on their first character, so matching is effectively
+# deterministic with none of the lazy quantifier's backtracking on long
+# or adversarial queries. Captures the full inner pattern, parens included.
+SIZE_PATTERN = re.compile(
+    r"size\s*\(\s*(\([^()]*\)(?:[^()]|\([^()]*\))*)\s*\)",
+    re.IGNORECASE,
+)
 WITH_PATTERN = re.compile(r"with\s*\.", re.IGNORECASE)
 APOC_PATTERN = re.compile(r"\bapoc\.", re.IGNORECASE)
 COUNT_RETURN_PATTERN = re.compile(r"count\s*\{\s*return", re.IGNORECASE)
@@ -13,6 +21,39 @@ TOSTRING_PATTERN = re.compile(
     r"toString\s*\(\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\)",
     re.IGNORECASE,
 )
+DOT_NAME_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\.name\b")
+APOC_TOSET_PATTERN = re.compile(
+    r"apoc\.coll\.toSet\s*\(\s*([^)]+)\s*\)",
+    re.IGNORECASE,
+)
+
+# Single-scan probe combining the triggers of every v5 rule; the group name
+# of each hit tells the rewriter which targeted rule needs to run.
+V5_PROBE_PATTERN = re.compile(
+    r"(?P<size>size\s*\(\s*\()"
+    r"|(?P<apoc>\bapoc\.)"
+    r"|(?P<count_return>count\s*\{\s*return)"
+    r"|(?P<collect_return>collect\s*\{\s*return)"
+    r"|(?P<tostring>toString\s*\()"
+    r"|(?P<with_dot>with\s*\.)",
+    re.IGNORECASE,
+)
+
+# Fast-path gate for rewrite(): if none of these tokens appear, no v5
+# rule (including WITH-scope repair) can fire and the query passes
+# straight to validation.
+REWRITE_TRIGGER_PATTERN = re.compile(
+    r"size\s*\(|\bapoc\.|toString\s*\(|\bwith\b|count\s*\{|collect\s*\{",
+    re.IGNORECASE,
+)
+
+# Write/admin operations the rewriter refuses to pass through. One
+# case-insensitive alternation scans the query in a single pass without
+# the per-needle substring checks (or the lowercased copy) they required.
+FORBIDDEN_PATTERN = re.compile(
+    r"call dbms|drop |delete |set |create |merge ",
+    re.IGNORECASE,
+)
 
 # --------
 # Rewriters
@@ -23,17 +64,15 @@ def rewrite_size_to_count(match: re.Match) -> str:
     size((a)--())  -> COUNT { (a)--() }
     """
     pattern = match.group(1)
-    return f"COUNT {{ ({pattern}) }}"
+    return f"COUNT {{ {pattern} }}"
 
 
-def rewrite_apoc_to_native(query: str) -> str:
+def rewrite_apoc_to_native(query: str) -> tuple[str, bool]:
     """
     Replace apoc.coll.toSet(x) -> collect(DISTINCT x)
+
+    Returns the rewritten query and whether any apoc.* usage remains,
+    so callers don't need to re-scan the result.
     """
-    query = re.sub(
-        r"apoc\.coll\.toSet\s*\(\s*([^)]+)\s*\)",
-        r"collect(DISTINCT \1)",
-        query,
-        flags=re.IGNORECASE,
-    )
-    return query
+    new_query = APOC_TOSET_PATTERN.sub(r"collect(DISTINCT \1)", query)
+    return new_query, APOC_PATTERN.search(new_query) is not None
@@ -2,15 +2,21 @@ import re
 
 VAR_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\b")
 
-CYPHER_KEYWORDS = {
+_KEYWORDS = (
     "MATCH", "WITH", "RETURN", "WHERE", "ORDER", "BY",
     "COUNT", "DISTINCT", "AS", "AND", "OR", "CASE", "DESC", "LIMIT",
     "WHEN", "THEN", "ELSE", "END", "NULL", "TRUE", "FALSE",
-    "TOFLOAT", "TOLONG", "TOSTRING"
-}
+    "TOFLOAT", "TOLONG", "TOSTRING",
+)
+
+# Hold every casing we expect to see so captured tokens can be tested
+# directly, without allocating an uppercased copy per token.
+CYPHER_KEYWORDS = frozenset(
+    variant for kw in _KEYWORDS for variant in (kw, kw.lower(), kw.title())
+) | frozenset(("toFloat", "toLong", "toString"))
 
 def extract_variables(expr: str) -> set[str]:
     return {
         v for v in VAR_PATTERN.findall(expr)
-        if v.upper() not in CYPHER_KEYWORDS
+        if v not in CYPHER_KEYWORDS
     }
@@ -1,3 +1,4 @@
+import functools
 from enum import Enum
 
 class Neo4jVersion(Enum):
@@ -5,6 +6,7 @@ class Neo4jVersion(Enum):
     V5 = "5"
 
 
+@functools.lru_cache(maxsize=64)
 def detect_version(version_string: str) -> Neo4jVersion:
     """
     Detect Neo4j version from version string.
@@ -13,14 +15,16 @@ def detect_version(version_string: str) -> Neo4jVersion:
       - Semantic: '5.12.0', '4.4.18'
       - Calendar: '2025.11.2' (treated as V5+)
 
+    Results are memoized; detection runs per query in the tool layer but
+    only ever sees a handful of distinct version strings.
+
     Args:
         version_string: Version string from Neo4j
 
     Returns:
         Neo4jVersion enum value (V4 or V5)
     """
-    major = version_string.split(".")[0]
-    major_int = int(major)
+    major_int = int(version_string.partition(".")[0])
 
     # Calendar-based versioning (2025+) is Neo4j 5+
     # Semantic versioning: 5+ is V5, 4 and below is V4
@@ -3,9 +3,9 @@ Lifecycle functions (initialization and cleanup) and Pydantic configuration mode
 for the Graph Database Agent Plugin.
 """
 
-from typing import Any, Dict, List, Optional, Literal
-import yaml
+from typing import Any, Dict, List, Optional, Literal, Tuple
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field, SecretStr, model_validator
 
@@ -52,6 +52,24 @@ class GraphAgentInitConfigModel(BaseModel):
     query_timeout: int = Field(
         default=30, description="Query timeout in seconds.", ge=5
     )
+    query_cache_ttl_seconds: int = Field(
+        default=60,
+        description="How long cached query results stay valid, in seconds. Set to 0 to disable result caching.",
+        ge=0,
+    )
+    query_cache_max_entries: int = Field(
+        default=128, description="Maximum number of cached query results.", ge=1
+    )
+    schema_cache_ttl_seconds: int = Field(
+        default=300,
+        description="How long detected schema information is trusted without re-checking, in seconds. Set to 0 to re-check on every access.",
+        ge=0,
+    )
+    max_result_rows: int = Field(
+        default=10000,
+        description="Maximum number of result rows collected per query before truncating.",
+        ge=1,
+    )
     database_purpose: Optional[str] = Field(
         default=None,
         description="Optional: A description of the database's purpose to help the LLM.",
@@ -144,7 +162,14 @@ def initialize_graph_agent(host_component: Any, init_config: GraphAgentInitConfi
     db_version: Optional[Tuple[str, int]] = None
     try:
         if init_config.db_type == "neo4j":
-            db_service = Neo4jService(connection_params, init_config.query_timeout)
+            db_service = Neo4jService(
+                connection_params,
+                init_config.query_timeout,
+                cache_ttl_seconds=init_config.query_cache_ttl_seconds,
+                cache_max_entries=init_config.query_cache_max_entries,
+                schema_cache_ttl_seconds=init_config.schema_cache_ttl_seconds,
+                max_rows=init_config.max_result_rows,
+            )
             db_version = db_service.db_version
         else:
             raise ValueError(f"Unsupported database type: {init_config.db_type}")
@@ -171,20 +196,51 @@ def initialize_graph_agent(host_component: Any, init_config: GraphAgentInitConfi
     try:
         if init_config.auto_detect_schema:
             log.debug("%s Auto-detecting database schema...", log_identifier)
-            schema_summary_for_llm = db_service.get_schema_summary_for_llm(
-                database=init_config.db_name
-            )
-            detailed_schema_dict = db_service.get_detailed_schema_representation(
-                database=init_config.db_name
-            )
+            # yaml is only needed on this branch; importing it here keeps it
+            # off the module's cold-start path (repeat calls hit the module
+            # cache and are free).
+            import yaml
+
+            try:
+                from yaml import CSafeDumper as YamlDumper
+            except ImportError:
+                from yaml import SafeDumper as YamlDumper
+            # The three introspection calls are independent I/O round trips;
+            # run them concurrently so startup waits for the slowest one
+            # instead of their sum. The Neo4j driver is thread-safe.
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                summary_future = pool.submit(
+                    db_service.get_schema_summary_for_llm,
+                    database=init_config.db_name,
+                )
+                detailed_future = pool.submit(
+                    db_service.get_detailed_schema_representation,
+                    database=init_config.db_name,
+                )
+                llm_optimized_future = pool.submit(
+                    db_service.get_llm_optimized_schema,
+                    database=init_config.db_name,
+                )
+                schema_summary_for_llm = summary_future.result()
+                detailed_schema_dict = detailed_future.result()
+                llm_optimized_schema = llm_optimized_future.result()
             detailed_schema_yaml = yaml.dump(
-                detailed_schema_dict, sort_keys=False, allow_unicode=True
+                detailed_schema_dict,
+                Dumper=YamlDumper,
+                sort_keys=False,
+                allow_unicode=True,
             )
-            llm_optimized_schema = db_service.get_llm_optimized_schema(
-                database=init_config.db_name
-            )
-            llm_optimized_schema_yaml = yaml.dump(
-                llm_optimized_schema, sort_keys=False, allow_unicode=True
+            # get_llm_optimized_schema already returns a prompt-ready string;
+            # only the fallback path hands back a dict that needs dumping.
+            llm_optimized_schema_yaml = (
+                llm_optimized_schema
+                if isinstance(llm_optimized_schema, str)
+                else yaml.dump(
+                    llm_optimized_schema,
+                    Dumper=YamlDumper,
+                    sort_keys=False,
+                    allow_unicode=True,
+                )
             )
             log.info("%s Schema auto-detection complete.", log_identifier)
         else:
@@ -198,6 +254,7 @@ def initialize_graph_agent(host_component: Any, init_config: GraphAgentInitConfi
                 )
             schema_summary_for_llm = init_config.schema_summary_override
             detailed_schema_yaml = init_config.database_schema_override
+            detailed_schema_dict = None
             log.info("%s Schema overrides applied.", log_identifier)
 
         if not schema_summary_for_llm:
@@ -219,6 +276,9 @@ def initialize_graph_agent(host_component: Any, init_config: GraphAgentInitConfi
         host_component.set_agent_specific_state(
             "db_detailed_schema_yaml", detailed_schema_yaml
         )
+        host_component.set_agent_specific_state(
+            "db_detailed_schema_dict", detailed_schema_dict
+        )
         host_component.set_agent_specific_state(
             "db_query_examples", init_config.query_examples or []
         )
@@ -243,61 +303,55 @@ def initialize_graph_agent(host_component: Any, init_config: GraphAgentInitConfi
         db_type_for_prompt = init_config.db_type
         purpose_for_prompt = init_config.database_purpose or "Not specified."
         description_for_prompt = init_config.data_description or "Not specified."
-        must_rules_list = init_config.must_rules or []
-        must_rules = ""
-        if must_rules_list:
-            must_rules_parts = []
-            must_rules_parts.append("\nYou MUST:")
-            for rule in must_rules_list:
-                must_rules_parts.append(f"- {rule}")
-            if must_rules_parts:
-                must_rules = "\n".join(must_rules_parts)
-        must_not_rules_list = init_config.must_not_rules or []
-        must_not_rules = ""
-        if must_not_rules_list:
-            must_not_rules_parts = []
-            must_not_rules_parts.append("\nYou MUST NOT:")
-            for rule in must_not_rules_list:
-                must_not_rules_parts.append(f"- {rule}")
-            if must_not_rules_parts:
-                must_not_rules = "\n".join(must_not_rules_parts)
         query_examples_list = host_component.get_agent_specific_state(
             "db_query_examples", []
         )
         formatted_query_examples = ""
         if query_examples_list:
-            example_parts = []
-            for ex in query_examples_list:
-                nl = (
-                    ex.natural_language
-                    if hasattr(ex, "natural_language")
-                    else ex.get("natural_language", "")
-                )
-                cypher = (
-                    ex.cypher_query
-                    if hasattr(ex, "cypher_query")
-                    else ex.get("cypher_query", "")
-                )
-                if nl and cypher:
-                    example_parts.append(f"Natural Language: {nl}\nCypher Query: {cypher}")
-            if example_parts:
-                formatted_query_examples = "\n\n".join(example_parts)
+            # The list is homogeneous (validated models from config, or raw
+            # dicts), so decide the access style once instead of probing
+            # every element with hasattr.
+            if isinstance(query_examples_list[0], GraphAgentQueryExample):
+                pairs = [
+                    (ex.natural_language, ex.cypher_query)
+                    for ex in query_examples_list
+                ]
+            else:
+                pairs = [
+                    (ex.get("natural_language", ""), ex.get("cypher_query", ""))
+                    for ex in query_examples_list
+                ]
+            formatted_query_examples = "\n\n".join(
+                f"Natural Language: {nl}\nCypher Query: {cypher}"
+                for nl, cypher in pairs
+                if nl and cypher
+            )
         current_timestamp = datetime.now(timezone.utc).isoformat()
+        # Build every segment into one flat list and join once at the end;
+        # the rules sections are appended directly rather than pre-joined
+        # into intermediate strings.
         instruction_parts = [
             f"You are a Cypher query assistant for a {db_type_for_prompt} graph database.",
-            "\n",
-            must_rules,
-            "\n",
-            must_not_rules,
-            "\n"
-            f"The current date and time are available as: {current_timestamp}",
-            "\nDATABASE CONTEXT:",
-            f"Purpose: {purpose_for_prompt}",
-            f"Data Description: {description_for_prompt}",
-            "\nDATABASE SCHEMA:",
-            llm_optimized_schema_yaml,
-            "---",
         ]
+        if init_config.must_rules:
+            instruction_parts.append("\nYou MUST:")
+            instruction_parts.extend(f"- {rule}" for rule in init_config.must_rules)
+        if init_config.must_not_rules:
+            instruction_parts.append("\nYou MUST NOT:")
+            instruction_parts.extend(
+                f"- {rule}" for rule in init_config.must_not_rules
+            )
+        instruction_parts.extend(
+            [
+                f"\nThe current date and time are available as: {current_timestamp}",
+                "\nDATABASE CONTEXT:",
+                f"Purpose: {purpose_for_prompt}",
+                f"Data Description: {description_for_prompt}",
+                "\nDATABASE SCHEMA:",
+                llm_optimized_schema_yaml,
+                "---",
+            ]
+        )
 
         if formatted_query_examples:
             instruction_parts.extend(
@@ -1,43 +1,256 @@
 """Service for handling graph database operations."""
 
+import atexit
+import hashlib
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from typing import Callable
 import yaml
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 from typing import List, Dict, Any, Generator, Optional
 
-from neo4j import GraphDatabase, Driver, Session
+from neo4j import GraphDatabase, Driver, Record, Session
 from neo4j.exceptions import Neo4jError
 from neo4j.graph import Node, Relationship
 
+try:
+    # neo4j >= 5.0: managed transaction functions with per-tx timeouts.
+    from neo4j import unit_of_work
+except ImportError:
+    unit_of_work = None
+
+try:
+    # neo4j >= 5.0: native asyncio driver API.
+    from neo4j import AsyncGraphDatabase
+except ImportError:
+    AsyncGraphDatabase = None
+
 from solace_ai_connector.common.log import log
 from typing import Tuple
 
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Neo4j drivers are thread-safe and designed to be shared for the lifetime
+# of the process; share one driver (and its connection pool) per endpoint
+# across all service instances, with a refcount so close() only tears the
+# pool down once the last user releases it.
+_DRIVER_CACHE: Dict[Tuple, Tuple[Driver, int]] = {}
+_DRIVER_CACHE_LOCK = threading.Lock()
+
+
+def _acquire_shared_driver(key: Tuple, factory: Callable[[], Driver]) -> Driver:
+    """Return the cached driver for key, creating it on first use."""
+    with _DRIVER_CACHE_LOCK:
+        entry = _DRIVER_CACHE.get(key)
+        if entry:
+            driver, refs = entry
+            _DRIVER_CACHE[key] = (driver, refs + 1)
+            return driver
+        driver = factory()
+        _DRIVER_CACHE[key] = (driver, 1)
+        return driver
+
+
+def _release_shared_driver(driver: Driver) -> bool:
+    """Drop one reference to driver. Returns True when it should be closed."""
+    with _DRIVER_CACHE_LOCK:
+        for key, (cached, refs) in list(_DRIVER_CACHE.items()):
+            if cached is driver:
+                if refs <= 1:
+                    del _DRIVER_CACHE[key]
+                    return True
+                _DRIVER_CACHE[key] = (cached, refs - 1)
+                return False
+    # Not a shared driver; let the caller close it.
+    return True
+
+
+def _close_all_shared_drivers() -> None:
+    with _DRIVER_CACHE_LOCK:
+        for driver, _ in _DRIVER_CACHE.values():
+            try:
+                driver.close()
+            except Exception:
+                pass
+        _DRIVER_CACHE.clear()
+
+
+atexit.register(_close_all_shared_drivers)
+
+
+def _build_bolt_uri(connection_params: Dict[str, Any]) -> str:
+    """Build a Neo4j URI from host/port connection parameters.
+
+    Uses the bolt:// protocol by default; a host that already carries a
+    scheme is passed through unchanged.
+    """
+    host = connection_params.get("host")
+    if not host:
+        raise ValueError("Neo4j host is required")
+    if "://" in host:
+        return host
+    uri = f"bolt://{host}"
+    port = connection_params.get("port")
+    if port:
+        uri += f":{port}"
+    return uri
+
+
+def _build_optimized_schema_string(session: Session) -> str:
+    """Build the compact LLM-facing schema string from an open session."""
+    nodes = session.run("""
+    CALL db.schema.nodeTypeProperties()
+    YIELD nodeType, propertyName
+    RETURN replace(nodeType, ':', '') AS label,
+        collect(DISTINCT propertyName) AS properties
+    """)
+
+    rels = session.run("""
+    CALL db.schema.visualization()
+    YIELD relationships
+    UNWIND relationships AS rel
+    RETURN DISTINCT
+    startNode(rel).labels[0] AS from,
+    type(rel) AS relationship,
+    endNode(rel).labels[0] AS to
+    """)
+
+    node_lines = [
+        f"- {n['label']}\n  Properties: {', '.join(n['properties'])}" for n in nodes
+    ]
+    rel_lines = [
+        f"- ({r['from']})-[:{r['relationship']}]->({r['to']})" for r in rels
+    ]
+    return (
+        "Graph Schema:\n\nNodes:\n"
+        + "\n".join(node_lines)
+        + "\n\nRelationships:\n"
+        + "\n".join(rel_lines)
+    )
+
+
+def _serialize_neo4j_item(item: Any) -> Any:
+    """Convert Neo4j graph objects inside a schema blob to plain dicts.
+
+    Scalars (the vast majority of values) pass through untouched, and
+    containers whose children needed no conversion are returned as-is so
+    unchanged subtrees are never copied.
+    """
+    if type(item) in _SCALAR_TYPES:
+        return item
+    if isinstance(item, Node):
+        return {
+            "id": item.id,
+            "labels": list(item.labels),
+            "properties": dict(item),
+        }
+    if isinstance(item, Relationship):
+        return {
+            "id": item.id,
+            "type": item.type,
+            "start_node": item.start_node.id,
+            "end_node": item.end_node.id,
+            "properties": dict(item),
+        }
+    if isinstance(item, list):
+        converted = [_serialize_neo4j_item(i) for i in item]
+        if all(c is i for c, i in zip(converted, item)):
+            return item
+        return converted
+    if isinstance(item, dict):
+        converted = {k: _serialize_neo4j_item(v) for k, v in item.items()}
+        if all(converted[k] is v for k, v in item.items()):
+            return item
+        return converted
+    return item
+
 
 class DatabaseService(ABC):
     """Abstract base class for graph database services."""
 
-    def __init__(self, connection_params: Dict[str, Any], query_timeout: int = 30):
+    def __init__(
+        self,
+        connection_params: Dict[str, Any],
+        query_timeout: int = 30,
+        cache_ttl_seconds: int = 60,
+        cache_max_entries: int = 128,
+        schema_cache_ttl_seconds: int = 300,
+        max_rows: int = 10000,
+    ):
         """Initialize the database service.
 
         Args:
             connection_params: Database connection parameters.
             query_timeout: Query timeout in seconds.
+            cache_ttl_seconds: How long cached query results stay valid.
+                Set to 0 to disable result caching.
+            cache_max_entries: Maximum number of cached query results.
+            schema_cache_ttl_seconds: How long cached schema information is
+                trusted without re-checking the fingerprint. Set to 0 to
+                fingerprint-check on every access.
+            max_rows: Maximum number of result rows execute_query collects
+                before truncating, bounding memory for runaway queries.
         """
         self.connection_params = connection_params
         self.query_timeout = query_timeout
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        self.schema_cache_ttl_seconds = schema_cache_ttl_seconds
+        self.max_rows = max_rows
         self.driver: Optional[Driver] = None
-        self.db_version: Optional[Tuple[str, int]] = None
+        self._db_version: Optional[Tuple[str, int]] = None
+        # Recently executed read queries, keyed by (database, query); LLM
+        # pipelines frequently resubmit identical Cypher, and a hit turns a
+        # Bolt round trip into a dict lookup. Insertion order doubles as LRU
+        # order via move_to_end.
+        self._query_cache: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]], bool]]" = (
+            OrderedDict()
+        )
+        self._query_cache_lock = threading.RLock()
+        # Dedicated executor for blocking Bolt calls, sized to the driver's
+        # connection pool so async callers neither over-subscribe the pool
+        # nor compete with unrelated work on the loop's default executor.
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=connection_params.get("max_connection_pool_size", 50),
+            thread_name_prefix="neo4j-cypher",
+        )
+        # Detected schema per database. Within the TTL the cached entry is
+        # trusted outright; after it expires a cheap count fingerprint
+        # decides whether the expensive introspection queries need to rerun.
+        # The derived YAML / LLM-optimized strings are cached alongside the
+        # dict so repeated prompt builds skip re-serialization too.
+        self._schema_cache: Dict[Optional[str], Dict[str, Any]] = {}
         try:
             self.driver = self._create_driver()
-            self.db_version = self._get_db_version()
             log.info(
-                "Database driver created successfully for type: %s with version %s",
+                "Database driver created successfully for type: %s",
                 self.__class__.__name__,
-                self.db_version[0] if self.db_version else "Unknown"
             )
         except Exception as e:
             log.error("Failed to create database driver: %s", e, exc_info=True)
 
+    @property
+    def db_version(self) -> Optional[Tuple[str, int]]:
+        """Database version, probed on first access and cached.
+
+        Keeping the probe out of __init__ saves a Bolt round trip on every
+        service construction for callers that never ask for the version.
+        """
+        if self._db_version is None:
+            try:
+                self._db_version = self._get_db_version()
+            except Exception as e:
+                log.error("Failed to detect database version: %s", e, exc_info=True)
+        return self._db_version
+
     @abstractmethod
     def _create_driver(self) -> Driver:
         """Create driver for database connection.
@@ -57,13 +270,21 @@ class DatabaseService(ABC):
         pass
 
     def close(self) -> None:
-        """Close the driver and its connections."""
+        """Release the driver, closing it once no other service shares it."""
+        self._db_executor.shutdown(wait=False)
         if self.driver:
             try:
-                self.driver.close()
-                log.info("Database driver closed successfully.")
+                if _release_shared_driver(self.driver):
+                    self.driver.close()
+                    log.info("Database driver closed successfully.")
+                else:
+                    log.info(
+                        "Database driver released; still shared by other services."
+                    )
             except Exception as e:
                 log.exception("Error closing database driver: %s", e)
+            finally:
+                self.driver = None
         else:
             log.warning("No database driver to close.")
 
@@ -95,15 +316,34 @@ class DatabaseService(ABC):
             if session:
                 session.close()
 
-    def execute_query(self, query: str, database: Optional[str] = None) -> List[Dict[str, Any]]:
+    def execute_query(
+        self,
+        query: str,
+        database: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        max_rows: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """Execute a Cypher query.
 
+        Passing values through parameters instead of interpolating them into
+        the query text lets Neo4j reuse one compiled plan across calls. Rows
+        are collected as they stream and collection stops at the row cap, so
+        a runaway query cannot exhaust memory before the caller's size
+        checks run.
+
+        The returned list is always the caller's to keep, but the row dicts
+        may be shared with the result cache: treat them as read-only.
+
         Args:
             query: Cypher query to execute.
             database: Optional database name.
+            parameters: Optional query parameters.
+            max_rows: Optional per-call row cap overriding the service-level
+                max_rows.
 
         Returns:
-            List of dictionaries containing query results.
+            Tuple of (result rows, truncated flag); the flag is True when
+            collection stopped at the row cap.
 
         Raises:
             Neo4jError: If query execution fails.
@@ -111,17 +351,256 @@ class DatabaseService(ABC):
         """
         if not self.driver:
             raise RuntimeError("Database driver is not initialized.")
+
+        cap = max_rows if max_rows is not None else self.max_rows
+        cacheable = self.cache_ttl_seconds > 0
+        cache_key = None
+        if cacheable:
+            try:
+                params_key = (
+                    tuple(sorted(parameters.items())) if parameters else None
+                )
+                cache_key = (database, query.strip(), params_key, cap)
+                # Probe explicitly: building the tuple never hashes the
+                # parameter values, only the dict lookup below would.
+                hash(cache_key)
+            except TypeError:
+                # Unsortable or unhashable parameter values (lists, maps);
+                # skip the cache for this call.
+                cacheable = False
+        if cacheable:
+            with self._query_cache_lock:
+                entry = self._query_cache.get(cache_key)
+                if entry and time.monotonic() - entry[0] < self.cache_ttl_seconds:
+                    self._query_cache.move_to_end(cache_key)
+                    # Shallow copy so a caller appending/removing rows
+                    # cannot poison the cached list.
+                    return list(entry[1]), entry[2]
+
+        def _collect_capped(result) -> Tuple[List[Dict[str, Any]], bool]:
+            rows: List[Dict[str, Any]] = []
+            truncated = False
+            for record in result:
+                if len(rows) >= cap:
+                    # A record exists beyond the cap, so rows were dropped;
+                    # a result of exactly cap rows is not truncated.
+                    truncated = True
+                    break
+                rows.append(record.data())
+            return rows, truncated
+
         try:
             with self._get_session(database=database) as session:
-                result = session.run(query)
-                return result.data()
+                if unit_of_work is not None:
+                    # Managed read transaction: transient-error retries and
+                    # read routing on clusters, with the server enforcing
+                    # query_timeout and freeing the connection on expiry.
+                    @unit_of_work(timeout=self.query_timeout)
+                    def _read(tx):
+                        return _collect_capped(tx.run(query, parameters or {}))
+
+                    rows, truncated = session.execute_read(_read)
+                else:
+                    # Explicit transaction so the server still enforces the
+                    # query timeout on older drivers.
+                    with session.begin_transaction(
+                        timeout=self.query_timeout
+                    ) as tx:
+                        result = tx.run(query, parameters or {})
+                        rows, truncated = _collect_capped(result)
+        except Neo4jError as e:
+            log.exception("Query execution error: %s", str(e))
+            raise
+
+        if cacheable:
+            with self._query_cache_lock:
+                self._query_cache[cache_key] = (
+                    time.monotonic(),
+                    list(rows),
+                    truncated,
+                )
+                self._query_cache.move_to_end(cache_key)
+                while len(self._query_cache) > self.cache_max_entries:
+                    self._query_cache.popitem(last=False)
+        return rows, truncated
+
+    def clear_query_cache(self) -> None:
+        """Drop all cached query results."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    def execute_query_stream(
+        self, query: str, database: Optional[str] = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Execute a Cypher query, yielding result rows as they arrive.
+
+        Unlike execute_query, rows are never materialized into a list, so
+        memory stays constant regardless of result size and the first row
+        is available after a single round trip.
+
+        Args:
+            query: Cypher query to execute.
+            database: Optional database name.
+
+        Yields:
+            Dictionaries containing individual result rows.
+
+        Raises:
+            Neo4jError: If query execution fails.
+            RuntimeError: If the driver was not initialized.
+        """
+        if not self.driver:
+            raise RuntimeError("Database driver is not initialized.")
+        try:
+            with self._get_session(database=database) as session:
+                with session.begin_transaction(timeout=self.query_timeout) as tx:
+                    result = tx.run(query)
+                    for record in result:
+                        yield record.data()
+        except Neo4jError as e:
+            log.exception("Query execution error: %s", str(e))
+            raise
+
+    def execute_query_streaming(
+        self,
+        query: str,
+        database: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[str], Generator[Record, None, None]]:
+        """Execute a Cypher query, returning its field names and a record stream.
+
+        The keys are available before the first record is consumed, so
+        tabular writers (e.g. CSV) can emit their header up front and stream
+        rows in constant memory. The underlying session stays open until the
+        returned iterator is exhausted or closed.
+
+        Args:
+            query: Cypher query to execute.
+            database: Optional database name.
+            parameters: Optional query parameters.
+
+        Returns:
+            Tuple of (ordered field names, iterator of neo4j Record objects).
+
+        Raises:
+            Neo4jError: If query execution fails.
+            RuntimeError: If the driver was not initialized.
+        """
+        if not self.driver:
+            raise RuntimeError("Database driver is not initialized.")
+
+        session = (
+            self.driver.session(database=database)
+            if database
+            else self.driver.session()
+        )
+        try:
+            tx = session.begin_transaction(timeout=self.query_timeout)
+            result = tx.run(query, parameters or {})
+            keys = list(result.keys())
+        except Exception:
+            session.close()
+            raise
+
+        def _records() -> Generator[Record, None, None]:
+            try:
+                for record in result:
+                    yield record
+            except Neo4jError as e:
+                log.exception("Query execution error: %s", str(e))
+                raise
+            finally:
+                try:
+                    tx.close()
+                finally:
+                    session.close()
+
+        return keys, _records()
+
+    def execute_query_records(
+        self,
+        query: str,
+        database: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> List[Record]:
+        """Execute a Cypher query and return the raw driver records.
+
+        Skips the per-row dict construction execute_query performs; callers
+        that only project a few fields can index records positionally or via
+        Record.value().
+
+        Args:
+            query: Cypher query to execute.
+            database: Optional database name.
+            parameters: Optional query parameters.
+
+        Returns:
+            List of neo4j Record objects.
+
+        Raises:
+            Neo4jError: If query execution fails.
+            RuntimeError: If the driver was not initialized.
+        """
+        if not self.driver:
+            raise RuntimeError("Database driver is not initialized.")
+        try:
+            with self._get_session(database=database) as session:
+                with session.begin_transaction(timeout=self.query_timeout) as tx:
+                    return list(tx.run(query, parameters or {}))
         except Neo4jError as e:
             log.exception("Query execution error: %s", str(e))
             raise
 
+    def _get_schema_fingerprint(
+        self, database: Optional[str] = None
+    ) -> Optional[Tuple[int, int, int]]:
+        """Compute a cheap fingerprint of the schema shape.
+
+        Args:
+            database: Optional database name.
+
+        Returns:
+            Tuple of (label_count, relationship_type_count, property_key_count),
+            or None if the counts could not be fetched.
+        """
+        try:
+            with self._get_session(database=database) as session:
+                with session.begin_transaction(timeout=self.query_timeout) as tx:
+                    labels = tx.run(
+                        "CALL db.labels() YIELD label RETURN count(label) AS c"
+                    ).single()["c"]
+                    rel_types = tx.run(
+                        "CALL db.relationshipTypes() YIELD relationshipType "
+                        "RETURN count(relationshipType) AS c"
+                    ).single()["c"]
+                    prop_keys = tx.run(
+                        "CALL db.propertyKeys() YIELD propertyKey "
+                        "RETURN count(propertyKey) AS c"
+                    ).single()["c"]
+            return (labels, rel_types, prop_keys)
+        except Exception as e:
+            log.warning("Could not compute schema fingerprint: %s", e)
+            return None
+
+    def invalidate_schema(self, database: Optional[str] = None) -> None:
+        """Drop cached schema information.
+
+        Args:
+            database: Database whose cache entry to drop, or None to drop all.
+        """
+        if database is None:
+            self._schema_cache.clear()
+        else:
+            self._schema_cache.pop(database, None)
+
     def get_schema(self, database: Optional[str] = None) -> Dict[str, Any]:
         """Get database schema including node labels, relationship types, and properties.
 
+        The detected schema is cached per database. Within
+        schema_cache_ttl_seconds the cache is returned without touching the
+        database; after that a cheap count fingerprint (labels, relationship
+        types, property keys) decides whether re-detection is needed.
+
         Args:
             database: Optional database name.
 
@@ -134,39 +613,34 @@ class DatabaseService(ABC):
         if not self.driver:
             raise RuntimeError("Database driver is not initialized.")
 
-        def serialize_neo4j_schema(raw_schema):
-            """Convert Neo4j objects to serializable dictionaries."""
-            def convert(item):
-                if isinstance(item, Node):
-                    return {
-                        "id": item.id,
-                        "labels": list(item.labels),
-                        "properties": dict(item)
-                    }
-                elif isinstance(item, Relationship):
-                    return {
-                        "id": item.id,
-                        "type": item.type,
-                        "start_node": item.start_node.id,
-                        "end_node": item.end_node.id,
-                        "properties": dict(item)
-                    }
-                elif isinstance(item, list):
-                    return [convert(i) for i in item]
-                elif isinstance(item, dict):
-                    return {k: convert(v) for k, v in item.items()}
-                else:
-                    return item
-            return convert(raw_schema)
+        now = time.monotonic()
+        cached = self._schema_cache.get(database)
+        if cached and now - cached["ts"] < self.schema_cache_ttl_seconds:
+            return cached["schema"]
+
+        fingerprint = self._get_schema_fingerprint(database)
+        if cached and fingerprint is not None and cached["fingerprint"] == fingerprint:
+            cached["ts"] = now
+            return cached["schema"]
 
         try:
             with self._get_session(database=database) as session:
-                result = session.run("CALL db.schema.visualization()")
-                schema_data = dict(result.single())
-                return serialize_neo4j_schema(schema_data)
+                with session.begin_transaction(timeout=self.query_timeout) as tx:
+                    result = tx.run("CALL db.schema.visualization()")
+                    schema_data = dict(result.single())
+                schema = _serialize_neo4j_item(schema_data)
         except Exception as e:
             log.warning("Could not fetch schema visualization: %s. Falling back to basic schema detection.", e)
-            return self._get_basic_schema(database)
+            schema = self._get_basic_schema(database)
+
+        self._schema_cache[database] = {
+            "ts": now,
+            "fingerprint": fingerprint,
+            "schema": schema,
+            "yaml": None,
+            "llm_optimized": None,
+        }
+        return schema
 
     def _get_basic_schema(self, database: Optional[str] = None) -> Dict[str, Any]:
         """Get basic schema information when visualization is not available.
@@ -194,23 +668,53 @@ class DatabaseService(ABC):
                 rel_types_result = session.run("CALL db.relationshipTypes()")
                 schema["relationship_types"] = [record["relationshipType"] for record in rel_types_result]
 
-                # Get property keys for each node label
-                for label in schema["node_labels"]:
-                    props_query = f"MATCH (n:`{label}`) RETURN keys(n) AS props LIMIT 100"
-                    props_result = session.run(props_query)
-                    all_props = set()
-                    for record in props_result:
-                        all_props.update(record["props"])
-                    schema["node_properties"][label] = list(all_props)
-
-                # Get property keys for each relationship type
-                for rel_type in schema["relationship_types"]:
-                    props_query = f"MATCH ()-[r:`{rel_type}`]->() RETURN keys(r) AS props LIMIT 100"
-                    props_result = session.run(props_query)
-                    all_props = set()
-                    for record in props_result:
-                        all_props.update(record["props"])
-                    schema["relationship_properties"][rel_type] = list(all_props)
+                # Collect property keys with the batched schema procedures
+                # (two round trips total) instead of one query per label and
+                # per relationship type.
+                try:
+                    node_props_result = session.run(
+                        "CALL db.schema.nodeTypeProperties() "
+                        "YIELD nodeType, propertyName "
+                        "RETURN nodeType, collect(DISTINCT propertyName) AS props"
+                    )
+                    for record in node_props_result:
+                        label = record["nodeType"].replace("`", "").lstrip(":")
+                        schema["node_properties"][label] = [
+                            p for p in record["props"] if p is not None
+                        ]
+                    rel_props_result = session.run(
+                        "CALL db.schema.relTypeProperties() "
+                        "YIELD relType, propertyName "
+                        "RETURN relType, collect(DISTINCT propertyName) AS props"
+                    )
+                    for record in rel_props_result:
+                        rel_type = record["relType"].replace("`", "").lstrip(":")
+                        schema["relationship_properties"][rel_type] = [
+                            p for p in record["props"] if p is not None
+                        ]
+                except Exception as proc_error:
+                    log.warning(
+                        "Schema property procedures unavailable (%s). "
+                        "Falling back to per-label property queries.",
+                        proc_error,
+                    )
+                    # Get property keys for each node label
+                    for label in schema["node_labels"]:
+                        props_query = f"MATCH (n:`{label}`) RETURN keys(n) AS props LIMIT 100"
+                        props_result = session.run(props_query)
+                        all_props = set()
+                        for record in props_result:
+                            all_props.update(record["props"])
+                        schema["node_properties"][label] = list(all_props)
+
+                    # Get property keys for each relationship type
+                    for rel_type in schema["relationship_types"]:
+                        props_query = f"MATCH ()-[r:`{rel_type}`]->() RETURN keys(r) AS props LIMIT 100"
+                        props_result = session.run(props_query)
+                        all_props = set()
+                        for record in props_result:
+                            all_props.update(record["props"])
+                        schema["relationship_properties"][rel_type] = list(all_props)
 
         except Exception as e:
             log.error("Error getting basic schema: %s", e, exc_info=True)
@@ -243,44 +747,35 @@ class DatabaseService(ABC):
         if not self.driver:
             raise RuntimeError("Database driver is not initialized.")
 
-        def get_optimized_schema(session: Generator[Session, None, None]) -> str :
-            nodes = session.run("""
-            CALL db.schema.nodeTypeProperties()
-            YIELD nodeType, propertyName
-            RETURN replace(nodeType, ':', '') AS label,
-                collect(DISTINCT propertyName) AS properties
-            """)
-
-            rels = db.run_query("""
-            CALL db.schema.visualization()
-            YIELD relationships
-            UNWIND relationships AS rel
-            RETURN DISTINCT
-            startNode(rel).labels[0] AS from,
-            type(rel) AS relationship,
-            endNode(rel).labels[0] AS to
-            """)
-
-            schema = ["Graph Schema:\n", "Nodes:"]
-            for n in nodes:
-                schema.append(f"- {n['label']}")
-                schema.append(f"  Properties: {', '.join(n['properties'])}")
-
-            schema.append("\nRelationships:")
-            for r in rels:
-                schema.append(
-                    f"- ({r['from']})-[:{r['relationship']}]->({r['to']})"
-                )
+        cached = self._schema_cache.get(database)
+        if (
+            cached
+            and cached["llm_optimized"] is not None
+            and time.monotonic() - cached["ts"] < self.schema_cache_ttl_seconds
+        ):
+            return cached["llm_optimized"]
 
-            return "\n".join(schema)
-        
         try:
             with self._get_session(database=database) as session:
-                result = get_optimized_schema(session)
-                return result
+                result = _build_optimized_schema_string(session)
         except Exception as e:
             log.warning("Could not fetch schema visualization: %s. Falling back to basic schema detection.", e)
-            return self._get_basic_schema(database)
+            # Keep the advertised str contract on the fallback path too.
+            fallback_schema = self._get_basic_schema(database)
+            try:
+                return yaml.dump(
+                    fallback_schema,
+                    Dumper=YamlDumper,
+                    sort_keys=False,
+                    allow_unicode=True,
+                )
+            except Exception:
+                return str(fallback_schema)
+
+        cached = self._schema_cache.get(database)
+        if cached:
+            cached["llm_optimized"] = result
+        return result
 
     def get_schema_summary_for_llm(self, database: Optional[str] = None) -> str:
         """Gets a YAML formatted summary of the database schema for LLM prompting.
@@ -296,9 +791,16 @@ class DatabaseService(ABC):
 
         schema_dict = self.get_detailed_schema_representation(database)
 
+        # get_schema just (re)validated the cache entry for this database;
+        # the YAML rendering of an unchanged schema dict is reusable as-is.
+        cached = self._schema_cache.get(database)
+        if cached and cached["yaml"] is not None and cached["schema"] is schema_dict:
+            return cached["yaml"]
+
         try:
-            return yaml.dump(
+            yaml_str = yaml.dump(
                 schema_dict,
+                Dumper=YamlDumper,
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
@@ -307,6 +809,10 @@ class DatabaseService(ABC):
             log.error("Failed to dump schema to YAML: %s", e)
             return str(schema_dict)
 
+        if cached and cached["schema"] is schema_dict:
+            cached["yaml"] = yaml_str
+        return yaml_str
+
 
 class Neo4jService(DatabaseService):
     """Neo4j database service implementation."""
@@ -317,27 +823,38 @@ class Neo4jService(DatabaseService):
         Returns:
             Neo4j Driver instance.
         """
-        host = self.connection_params.get("host")
-        port = self.connection_params.get("port")
         user = self.connection_params.get("user")
         password = self.connection_params.get("password")
-
-        # Construct Neo4j URI
-        if not host:
-            raise ValueError("Neo4j host is required")
-
-        # Use bolt:// protocol by default
-        if "://" not in host:
-            uri = f"bolt://{host}"
-            if port:
-                uri += f":{port}"
-        else:
-            uri = host
-
-        return GraphDatabase.driver(
-            uri,
-            auth=(user, password) if user and password else None,
-            connection_timeout=self.query_timeout,
+        uri = _build_bolt_uri(self.connection_params)
+
+        # Pool tuning is overridable per endpoint through connection_params;
+        # the defaults bound pool size and acquisition waits under concurrent
+        # agent traffic. The resolved values are part of the share key so two
+        # services with different tuning never silently share one pool, and a
+        # digest of the password is included so a service constructed with a
+        # rotated credential gets a fresh driver instead of reusing one that
+        # keeps authenticating with the stale secret.
+        pool_config = (
+            self.connection_params.get("max_connection_pool_size", 50),
+            self.connection_params.get("connection_acquisition_timeout", 30),
+            self.connection_params.get("max_connection_lifetime", 3600),
+            self.connection_params.get("keep_alive", True),
+        )
+        password_digest = (
+            hashlib.sha256(password.encode()).hexdigest() if password else None
+        )
+        return _acquire_shared_driver(
+            (uri, user, password_digest, pool_config),
+            lambda: GraphDatabase.driver(
+                uri,
+                auth=(user, password) if user and password else None,
+                connection_timeout=self.query_timeout,
+                max_connection_pool_size=pool_config[0],
+                connection_acquisition_timeout=pool_config[1],
+                max_connection_lifetime=pool_config[2],
+                max_transaction_retry_time=15,
+                keep_alive=pool_config[3],
+            ),
         )
 
     def _get_db_version(self) -> Tuple[str, int]:
@@ -366,18 +883,109 @@ class Neo4jService(DatabaseService):
             if not record:
                 raise RuntimeError("Version query returned no results")
 
-            # Neo4j Record objects need to be accessed directly, not checked with 'in'
-            try:
-                full_version = record["version"]
-            except (KeyError, TypeError) as e:
-                available_keys = list(record.keys()) if record else []
+            # Record.value returns None for a missing key instead of walking
+            # the __getitem__/KeyError path.
+            full_version = record.value("version")
+            if full_version is None:
                 raise RuntimeError(
-                    f"Version query result missing 'version' key. Available keys: {available_keys}. Record: {dict(record) if record else None}"
-                ) from e
+                    f"Version query result missing 'version' key. Available keys: {list(record.keys())}"
+                )
 
             major_version = int(full_version.split(".")[0])
             log.info("Detected Neo4j version: %s", full_version)
             return full_version, major_version
         except Exception as e:
             log.error("Error detecting Neo4j version: %s", e, exc_info=True)
-            raise RuntimeError(f"Unable to determine Neo4j version: {e}") from e
\ No newline at end of file
+            raise RuntimeError(f"Unable to determine Neo4j version: {e}") from e
+
+
+class AsyncNeo4jService:
+    """Neo4j service backed by the driver's native asyncio API.
+
+    Alternative to Neo4jService for fully async callers: queries run on
+    the event loop itself, so concurrent tool invocations overlap on a
+    handful of connections without any thread hop. The tool layer awaits
+    execute_query directly when the handler exposes it as a coroutine.
+    """
+
+    def __init__(
+        self,
+        connection_params: Dict[str, Any],
+        query_timeout: int = 30,
+        max_rows: int = 10000,
+    ):
+        """Initialize the async database service.
+
+        Args:
+            connection_params: Database connection parameters.
+            query_timeout: Query timeout in seconds.
+            max_rows: Maximum number of result rows execute_query collects
+                before truncating.
+
+        Raises:
+            RuntimeError: If the installed neo4j driver has no async API.
+        """
+        if AsyncGraphDatabase is None:
+            raise RuntimeError(
+                "The installed neo4j driver does not provide the async API."
+            )
+        self.connection_params = connection_params
+        self.query_timeout = query_timeout
+        self.max_rows = max_rows
+        user = connection_params.get("user")
+        password = connection_params.get("password")
+        self.driver = AsyncGraphDatabase.driver(
+            _build_bolt_uri(connection_params),
+            auth=(user, password) if user and password else None,
+            connection_timeout=query_timeout,
+            max_connection_pool_size=connection_params.get(
+                "max_connection_pool_size", 50
+            ),
+            connection_acquisition_timeout=connection_params.get(
+                "connection_acquisition_timeout", 30
+            ),
+            keep_alive=connection_params.get("keep_alive", True),
+        )
+
+    async def execute_query(
+        self,
+        query: str,
+        database: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        max_rows: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Execute a Cypher query on the event loop.
+
+        Args:
+            query: Cypher query to execute.
+            database: Optional database name.
+            parameters: Optional query parameters.
+            max_rows: Optional per-call row cap overriding the service-level
+                max_rows.
+
+        Returns:
+            Tuple of (result rows, truncated flag); the flag is True when
+            collection stopped at the row cap.
+
+        Raises:
+            Neo4jError: If query execution fails.
+        """
+        cap = max_rows if max_rows is not None else self.max_rows
+        try:
+            async with self.driver.session(database=database) as session:
+                result = await session.run(query, parameters or {})
+                rows: List[Dict[str, Any]] = []
+                truncated = False
+                async for record in result:
+                    if len(rows) >= cap:
+                        truncated = True
+                        break
+                    rows.append(record.data())
+                return rows, truncated
+        except Neo4jError as e:
+            log.exception("Query execution error: %s", str(e))
+            raise
+
+    async def close(self) -> None:
+        """Close the async driver and its connection pool."""
+        await self.driver.close()
\ No newline at end of file
@@ -5,9 +5,24 @@ ADK Tools for the Graph Database Agent Plugin.
 from solace_ai_connector.common.log import log
 
 import yaml
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import csv
+import functools
+import inspect
 import io
+import uuid
 import asyncio
 import datetime
 from typing import Any, Dict, List, Optional, Literal
@@ -30,12 +45,55 @@ from solace_agent_mesh.agent.utils.artifact_helpers import (
     ensure_correct_extension,
 )
 
+_VALID_RESPONSE_FORMATS = frozenset(("yaml", "json", "csv"))
+
+
+def _register_neo4j_representers(dumper_cls) -> None:
+    """
+    Teach the YAML dumper about Neo4j driver types (temporal, spatial,
+    graph entities) so raw query results can be dumped without a separate
+    stringification pass.
+    """
+    try:
+        from neo4j import graph as neo4j_graph
+        from neo4j import time as neo4j_time
+        from neo4j import spatial as neo4j_spatial
+    except ImportError:
+        return
+
+    def _represent_as_str(dumper, value):
+        return dumper.represent_str(str(value))
+
+    def _represent_node(dumper, node):
+        return dumper.represent_dict(
+            {"labels": list(node.labels), "properties": dict(node)}
+        )
+
+    def _represent_relationship(dumper, rel):
+        return dumper.represent_dict({"type": rel.type, "properties": dict(rel)})
+
+    for cls in (
+        neo4j_time.DateTime,
+        neo4j_time.Date,
+        neo4j_time.Time,
+        neo4j_time.Duration,
+    ):
+        dumper_cls.add_multi_representer(cls, _represent_as_str)
+    dumper_cls.add_multi_representer(neo4j_spatial.Point, _represent_as_str)
+    dumper_cls.add_multi_representer(neo4j_graph.Node, _represent_node)
+    dumper_cls.add_multi_representer(neo4j_graph.Relationship, _represent_relationship)
+    dumper_cls.add_multi_representer(neo4j_graph.Path, _represent_as_str)
+
+
+_register_neo4j_representers(YamlDumper)
+
 async def execute_cypher_query(
     query: str,
     output_filename: Optional[str] = None,
     result_description: Optional[str] = None,
     response_format: Literal["yaml", "json", "csv"] = "csv",
     inline_result: bool = True,
+    parameters: Optional[Dict[str, Any]] = None,
     tool_context: ToolContext = None,
     tool_config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
@@ -52,6 +110,8 @@ async def execute_cypher_query(
                          Defaults to 'csv'. May contain embeds.
         inline_result: If True, attempts to return results inline if they are small enough.
                        Note that the result will always be saved as an artifact regardless of this setting
+        parameters: Optional query parameters, referenced from the query as $name.
+                    Prefer these over interpolating values into the query text.
         tool_context: The context provided by the ADK framework.
 
     Returns:
@@ -65,7 +125,10 @@ async def execute_cypher_query(
             "cypher_query_attempted": query,
         }
 
-    log_identifier = f"[CypherExecuteTool:{tool_context._invocation_context.agent.name}]"
+    # Resolve the invocation context and host component once; both are
+    # re-used throughout the call.
+    inv_context = tool_context._invocation_context
+    log_identifier = f"[CypherExecuteTool:{inv_context.agent.name}]"
     log.debug(
         "%s Executing cypher query. Format: %s, Inline: %s",
         log_identifier,
@@ -74,9 +137,7 @@ async def execute_cypher_query(
     )
     log.debug("%s Cypher Query: %s", log_identifier, query)
 
-    host_component = getattr(
-        tool_context._invocation_context.agent, "host_component", None
-    )
+    host_component = getattr(inv_context.agent, "host_component", None)
     if not host_component:
         return {
             "status": "error",
@@ -123,68 +184,158 @@ async def execute_cypher_query(
             "cypher_query_attempted": safe_query,
         }
 
-    valid_formats = ["yaml", "json", "csv"]
-    if response_format.lower() not in valid_formats:
+    response_format = response_format.lower()
+    if response_format not in _VALID_RESPONSE_FORMATS:
         return {
             "status": "error",
-            "error_message": f"Invalid response_format '{response_format}'. Must be one of {valid_formats}.",
+            "error_message": f"Invalid response_format '{response_format}'. Must be one of {sorted(_VALID_RESPONSE_FORMATS)}.",
             "cypher_query_attempted": safe_query,
         }
 
     try:
-        results: List[Dict[str, Any]] = await asyncio.to_thread(
-            db_handler.execute_query, safe_query, db_name
-        )
+        results: List[Dict[str, Any]]
+        if asyncio.iscoroutinefunction(db_handler.execute_query):
+            # Async handlers (AsyncNeo4jService) run on the event loop
+            # itself; await directly with no thread hop.
+            results, rows_truncated = await db_handler.execute_query(
+                safe_query, db_name, parameters=parameters
+            )
+        else:
+            # Run the blocking Bolt call on the handler's dedicated
+            # executor (sized to the driver pool) when it provides one;
+            # duck-typed handlers without an executor fall back to the
+            # loop's default executor.
+            db_executor = getattr(db_handler, "_db_executor", None)
+            if db_executor is not None:
+                loop = asyncio.get_running_loop()
+                results, rows_truncated = await loop.run_in_executor(
+                    db_executor,
+                    functools.partial(
+                        db_handler.execute_query,
+                        safe_query,
+                        db_name,
+                        parameters=parameters,
+                    ),
+                )
+            else:
+                # Duck-typed handler: it may predate the parameters kwarg
+                # and the (rows, truncated) return contract, so adapt to
+                # whichever shape it implements.
+                query_call = functools.partial(
+                    db_handler.execute_query, safe_query, db_name
+                )
+                try:
+                    accepts_parameters = (
+                        "parameters"
+                        in inspect.signature(db_handler.execute_query).parameters
+                    )
+                except (TypeError, ValueError):
+                    accepts_parameters = False
+                if accepts_parameters:
+                    query_call = functools.partial(
+                        query_call, parameters=parameters
+                    )
+                elif parameters:
+                    log.warning(
+                        "%s Database handler %s does not accept query parameters; ignoring them.",
+                        log_identifier,
+                        type(db_handler).__name__,
+                    )
+                raw_results = await asyncio.to_thread(query_call)
+                if isinstance(raw_results, tuple):
+                    results, rows_truncated = raw_results
+                else:
+                    results, rows_truncated = raw_results, False
         log.info(
             "%s Cypher query executed successfully. Number of rows returned: %d",
             log_identifier,
             len(results),
         )
 
-        formatted_content_str: str
         output_mime_type: str
         file_extension: str
 
+        # Serialize straight into a bytes buffer so the full result is only
+        # materialized once, instead of building a str and re-encoding it.
+        buffer = io.BytesIO()
+        text_stream = io.TextIOWrapper(
+            buffer, encoding="utf-8", newline="", write_through=True
+        )
         if response_format == "yaml":
-            formatted_content_str = yaml.dump(
-                results, allow_unicode=True, sort_keys=False
+            yaml.dump(
+                results,
+                text_stream,
+                Dumper=YamlDumper,
+                allow_unicode=True,
+                sort_keys=False,
             )
             output_mime_type = "application/yaml"
             file_extension = "yaml"
         elif response_format == "json":
-            formatted_content_str = json.dumps(results, indent=2, default=str)
+            if orjson is not None:
+                # orjson serializes straight to bytes and is ~5-10x faster
+                # than the stdlib encoder on large result sets.
+                buffer.write(
+                    orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str)
+                )
+            else:
+                json.dump(results, text_stream, indent=2, default=str)
             output_mime_type = "application/json"
             file_extension = "json"
         else:
             if not results:
-                formatted_content_str = "No results found."
+                text_stream.write("No results found.")
             else:
-                output = io.StringIO()
-                fieldnames = list(results[0].keys()) if results else []
-                writer = csv.DictWriter(output, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(results)
-                formatted_content_str = output.getvalue()
+                # Fast path: assume the first row's keys are representative;
+                # only union keys across all rows when shapes actually differ.
+                first_keys = results[0].keys()
+                fieldnames = list(first_keys)
+                if any(row.keys() != first_keys for row in results[1:]):
+                    seen = dict.fromkeys(fieldnames)
+                    for row in results[1:]:
+                        for key in row:
+                            if key not in seen:
+                                seen[key] = None
+                    fieldnames = list(seen)
+                # csv.writer avoids DictWriter's per-row fieldname remapping.
+                writer = csv.writer(text_stream)
+                writer.writerow(fieldnames)
+                writer.writerows(
+                    [row.get(name, "") for name in fieldnames] for row in results
+                )
             output_mime_type = "text/csv"
             file_extension = "csv"
 
-        content_bytes = formatted_content_str.encode("utf-8")
+        text_stream.flush()
+        content_bytes = buffer.getvalue()
 
+        # Only decode an inline copy when it will actually be returned;
+        # with inline_result=False the bytes go straight to the artifact.
         inline_truncated_warning = ""
-        if inline_result and len(content_bytes) > max_inline_result_size_bytes:
-            formatted_content_str = (
-                formatted_content_str[: max_inline_result_size_bytes - 3] + "..."
-            )
-            inline_truncated_warning = (
-                f"\n\n**Warning:** Result size ({len(content_bytes)} bytes) exceeds "
-                f"inline limit ({max_inline_result_size_bytes} bytes). "
-                "Returning truncated result inline. Fetch artifact for full results.\n\n"
-            )
+        inline_content = ""
+        if inline_result:
+            if len(content_bytes) > max_inline_result_size_bytes:
+                inline_content = (
+                    content_bytes[: max(0, max_inline_result_size_bytes - 3)].decode(
+                        "utf-8", errors="ignore"
+                    )
+                    + "..."
+                )
+                inline_truncated_warning = (
+                    f"\n\n**Warning:** Result size ({len(content_bytes)} bytes) exceeds "
+                    f"inline limit ({max_inline_result_size_bytes} bytes). "
+                    "Returning truncated result inline. Fetch artifact for full results.\n\n"
+                )
+            else:
+                inline_content = content_bytes.decode("utf-8")
 
         # Determine base filename
-        base_filename = (
-            output_filename or f"cypher_query_result_{tool_context.function_call_id[-8:]}"
+        unique_suffix = (
+            tool_context.function_call_id[-8:]
+            if getattr(tool_context, "function_call_id", None)
+            else uuid.uuid4().hex[:8]
         )
+        base_filename = output_filename or f"cypher_query_result_{unique_suffix}"
         # Ensure correct extension
         artifact_filename = ensure_correct_extension(base_filename, file_extension)
 
@@ -195,7 +346,6 @@ async def execute_cypher_query(
             artifact_filename,
         )
 
-        inv_context = tool_context._invocation_context
         artifact_service = inv_context.artifact_service
         if not artifact_service:
             raise ValueError(
@@ -234,6 +384,12 @@ async def execute_cypher_query(
 
         version = save_result["data_version"]
         message_to_llm = f"Cypher query executed. Results saved to artifact '{artifact_filename}' (version {version})."
+        if rows_truncated:
+            message_to_llm += (
+                f"\n\n**Warning:** The query returned more rows than the configured "
+                f"maximum ({len(results)}); results were truncated. "
+                "Add a LIMIT clause or narrow the query for complete results."
+            )
         if response_guidelines:
             message_to_llm += f"\n\n### RESPONSE GUIDELINES - FOLLOW THESE EXACTLY ###\n{response_guidelines}\n### END GUIDELINES ###"
 
@@ -246,7 +402,7 @@ async def execute_cypher_query(
             "artifact_filename": artifact_filename,
             "artifact_version": version,
             "row_count": len(results),
-            "content": formatted_content_str,
+            "content": inline_content,
         }
 
     except Exception as e: